@@ -1,14 +1,24 @@
+from functools import lru_cache
+
 from django.core.exceptions import ValidationError
 from allauth.account.adapter import DefaultAccountAdapter
 from allauth.socialaccount.adapter import DefaultSocialAccountAdapter
 
-ALLOWED_EMAIL_DOMAINS = ['bc.edu']  # Add the allowed domain here
+ALLOWED_EMAIL_DOMAINS = frozenset({'bc.edu'})  # Add the allowed domain here
+
+
+@lru_cache(maxsize=4096)
+def _is_allowed_domain(email: str) -> tuple[bool, str]:
+    """Return (allowed, domain) for an email address; cached per address."""
+    domain = email.rpartition('@')[2].lower()
+    return domain in ALLOWED_EMAIL_DOMAINS, domain
+
 
 class CustomAccountAdapter(DefaultAccountAdapter):
     def clean_email(self, email):
         email = super().clean_email(email)
-        domain = email.split('@')[1]
-        if domain not in ALLOWED_EMAIL_DOMAINS:
+        allowed, domain = _is_allowed_domain(email)
+        if not allowed:
             raise ValidationError(
                 f'You must sign up with a bc.edu email address. You entered {domain}.'
             )
@@ -18,8 +28,8 @@ class CustomSocialAccountAdapter(DefaultSocialAccountAdapter):
     def pre_social_login(self, request, sociallogin):
         email = sociallogin.account.extra_data.get('email')
         if email:
-            domain = email.split('@')[1]
-            if domain not in ALLOWED_EMAIL_DOMAINS:
+            allowed, domain = _is_allowed_domain(email)
+            if not allowed:
                 raise ValidationError(
                     f'You must sign in with a bc.edu email address. You entered {domain}.'
                 )
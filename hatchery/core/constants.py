@@ -7,6 +7,8 @@ ROLE_TEAM_MEMBER = 'Team Member'
 ROLE_STAFF = 'Staff'
 
 ROLES = [ROLE_USER, ROLE_COLLABORATOR, ROLE_TEAM_MEMBER, ROLE_STAFF]
+# Hashed lookup for membership checks on hot paths
+ROLES_SET = frozenset(ROLES)
 
 # Team Lead is a flag that only applies to Team Members
 TEAM_LEAD_ELIGIBLE_ROLE = ROLE_TEAM_MEMBER
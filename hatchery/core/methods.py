@@ -10,12 +10,20 @@ from __future__ import annotations
 from typing import Any, Dict, Optional, Union
 
 from django.contrib.auth.models import AnonymousUser
+from django.db.models import Q
+from django.db.models.functions import Lower
+from django.utils import timezone
 
+from core import constants as const
+from pct.methods import get_course
 from pct.models import Person, Certification, TrainingRecord
 from cmr.models import Machine, Reservation
 
+# Distinguishes "not looked up yet" from a cached "no Person" (None)
+_SENTINEL = object()
 
-def _get_person_for_user(user) -> Optional[Dict[str, Any]]:
+
+def _get_person_for_user(user) -> Optional[Person]:
     """Map a Django user to an existing Person row by email.
 
     Assumes the user is authenticated (not anonymous) and a Person record already exists.
@@ -24,48 +32,43 @@ def _get_person_for_user(user) -> Optional[Dict[str, Any]]:
         user: Django User instance (from request.user or similar) - must be authenticated
 
     Returns:
-        Dict with 'name' (full name) and 'type' (role), or None if no email or no matching Person exists.
+        The matching Person instance, or None if no email or no matching Person exists.
+        Only the columns used by the helpers in this module are loaded.
 
     Example Input:
         user = request.user  # Django User with email='bob@example.com'
 
-    Example Output (person exists - Team Member):
-        {
-            'name': 'Bob Smith',
-            'type': 'Team Member'
-        }
-
-    Example Output (person exists - Team Lead):
-        {
-            'name': 'Alice Johnson',
-            'type': 'Team Lead'
-        }
-
-    Example Output (person exists - Staff):
-        {
-            'name': 'Carol Williams',
-            'type': 'Staff'
-        }
+    Example Output (person exists):
+        <Person: Bob Smith>
 
     Example Output (person doesn't exist):
         None
 
     Returns None if the user has no email or no Person record exists for that email.
+
+    The result is memoized on the user instance, so repeated calls within one
+    request only query the database once.
     """
+    cached = getattr(user, "_cached_pct_person", _SENTINEL)
+    if cached is not _SENTINEL:
+        return cached
+
     email = getattr(user, "email", None)
     if not email:
         return None
-    # Direct model query - only retrieve, never create
+    # Direct model query - only retrieve, never create. Matching on LOWER(email)
+    # uses the case-insensitive unique index. Columns outside only() (e.g. user_id)
+    # are deferred; reading them later costs an extra query per access.
     try:
-        person = Person.objects.get(email=email)
-        # Determine type: if Team Member and is_team_lead, type is 'Team Lead'
-        person_type = 'Team Lead' if (person.role == 'Team Member' and person.is_team_lead) else person.role
-        return {
-            'name': f"{person.first_name} {person.last_name}".strip(),
-            'type': person_type
-        }
+        person = (
+            Person.raw_objects.alias(email_lower=Lower("email"))
+            .only("id", "first_name", "last_name", "email", "role", "is_team_lead")
+            .get(email_lower=email.lower())
+        )
     except Person.DoesNotExist:
-        return None
+        person = None
+    user._cached_pct_person = person
+    return person
 
 
 def get_user_training_summary(user) -> Optional[Dict[str, Any]]:
@@ -119,35 +122,32 @@ def get_user_training_summary(user) -> Optional[Dict[str, Any]]:
 
     Returns None if the user is anonymous or has no email.
     """
-    person_info = _get_person_for_user(user)
-    if not person_info:
+    person = _get_person_for_user(user)
+    if person is None:
         return None
 
-    # Retrieve the actual Person instance for querying certifications and training
-    email = getattr(user, "email", None)
-    try:
-        person = Person.objects.get(email=email)
-    except Person.DoesNotExist:
-        return None
-
-    certs = [
-        {
-            "name": c.name,
-            "issued_at": c.issued_at,
-            "expires_at": c.expires_at,
-        }
-        for c in person.certifications.all().order_by("-issued_at", "name")
-    ]
-
+    certs = list(
+        person.certifications.order_by("-issued_at", "name").values("name", "issued_at", "expires_at")
+    )
+
+    # values() skips model hydration; course details come from the cached catalog
+    records = person.training_records.order_by("-completed_at").values(
+        "course_name",
+        "completed_at",
+        "training_course_id",
+    )
+    if person.role == const.ROLE_STAFF:
+        # Staff accumulate long training histories; stream rows in chunks to bound memory
+        records = records.iterator(chunk_size=200)
     trainings = []
-    for tr in person.training_records.select_related("training_course").all().order_by("-completed_at"):
-        tc = tr.training_course
+    for r in records:
+        tc = get_course(r["training_course_id"]) if r["training_course_id"] is not None else None
         trainings.append(
             {
-                "course_name": tr.course_name,
-                "completed_at": tr.completed_at,
+                "course_name": r["course_name"],
+                "completed_at": r["completed_at"],
                 "training_course": (
-                    {"id": tc.id, "category": getattr(tc, "category", None), "level": getattr(tc, "level", None)}
+                    {"id": tc.id, "category": tc.category, "level": tc.level}
                     if tc is not None
                     else None
                 ),
@@ -174,6 +174,9 @@ def machine_available(
 ) -> Union[bool, Dict[str, Any]]:
     """Check if a machine is available in the [start, end) window.
 
+    Reservations store a local date plus start/end times, so aware datetimes are
+    converted to local time first. Rejected reservations do not block the machine.
+
     Args:
         machine: Machine instance or machine ID
         start: Start datetime (timezone-aware)
@@ -214,35 +217,45 @@ def machine_available(
             'available': False,
             'conflict': {
                 'id': 87,
-                'person_email': 'bob@example.com',
-                'start': datetime(2025, 11, 5, 13, 0, tzinfo=timezone.utc),
-                'end': datetime(2025, 11, 5, 15, 0, tzinfo=timezone.utc)
+                'user__email': 'bob@example.com',
+                'date': date(2025, 11, 5),
+                'start_time': time(13, 0),
+                'end_time': time(15, 0)
             }
         }
     """
-    if isinstance(machine, Machine):
-        machine_obj = machine
+    # Filter on the FK column directly so an ID never needs a Machine lookup
+    machine_id = machine.pk if isinstance(machine, Machine) else machine
+
+    if timezone.is_aware(start):
+        start = timezone.localtime(start)
+    if timezone.is_aware(end):
+        end = timezone.localtime(end)
+    start_date, start_time = start.date(), start.time()
+    end_date, end_time = end.date(), end.time()
+
+    if start_date == end_date:
+        window = Q(date=start_date, start_time__lt=end_time, end_time__gt=start_time)
     else:
-        machine_obj = Machine.objects.get(pk=machine)
+        # The window crosses midnight: the tail of the first day, any whole days
+        # in between, and the head of the last day
+        window = (
+            Q(date=start_date, end_time__gt=start_time)
+            | Q(date__gt=start_date, date__lt=end_date)
+            | Q(date=end_date, start_time__lt=end_time)
+        )
 
-    # Direct query instead of calling cmr.services.has_conflict
-    conflict_exists = Reservation.objects.filter(
-        machine=machine_obj,
-        start__lt=end,
-        end__gt=start,
-    ).exists()
+    # Direct query on the reservation's date/time columns
+    overlapping = Reservation.objects.filter(window, machine_id=machine_id).exclude(status="rejected")
 
     if not include_conflict:
-        return not conflict_exists
-
-    conflict = None
-    if conflict_exists:
-        # Fetch a representative overlapping reservation
-        conflict = (
-            Reservation.objects.filter(machine=machine_obj, start__lt=end, end__gt=start)
-            .order_by("start")
-            .values("id", "person_email", "start", "end")
-            .first()
-        )
+        return not overlapping.exists()
+
+    # A single query both answers availability and fetches a representative conflict
+    conflict = (
+        overlapping.order_by("date", "start_time")
+        .values("id", "user__email", "date", "start_time", "end_time")
+        .first()
+    )
 
-    return {"available": not conflict_exists, "conflict": conflict}
+    return {"available": conflict is None, "conflict": conflict}
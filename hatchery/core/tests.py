@@ -1,3 +1,91 @@
-from django.test import TestCase
+from datetime import date, datetime, time, timezone as dt_timezone
 
-# Create your tests here.
+from django.contrib.auth.models import User
+from django.test import TestCase, override_settings
+
+from cmr.models import Machine, Reservation
+from core.methods import machine_available
+
+
+def utc(day, hour, minute=0):
+    return datetime(2025, 11, day, hour, minute, tzinfo=dt_timezone.utc)
+
+
+class MachineAvailableTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create(username="bob", email="bob@example.com")
+        cls.machine = Machine.objects.create(name="Laser", custom_id="M-LC-01", category="Laser")
+        cls.other = Machine.objects.create(name="Vinyl", custom_id="M-VC-01", category="Vinyl")
+        cls.booking = cls.reserve(date(2025, 11, 5), time(13), time(15))
+
+    @classmethod
+    def reserve(cls, day, start, end, **extra):
+        return Reservation.objects.create(
+            machine=cls.machine,
+            user=cls.user,
+            reservation_title="Booking",
+            date=day,
+            start_time=start,
+            end_time=end,
+            **extra,
+        )
+
+    def test_overlapping_reservation_conflicts(self):
+        self.assertFalse(machine_available(self.machine, utc(5, 14), utc(5, 16)))
+        self.assertFalse(machine_available(self.machine, utc(5, 13, 30), utc(5, 14)))
+
+    def test_adjacent_windows_do_not_conflict(self):
+        self.assertTrue(machine_available(self.machine, utc(5, 15), utc(5, 16)))
+        self.assertTrue(machine_available(self.machine, utc(5, 11), utc(5, 13)))
+
+    def test_other_machine_and_day_do_not_conflict(self):
+        self.assertTrue(machine_available(self.other, utc(5, 14), utc(5, 16)))
+        self.assertTrue(machine_available(self.machine, utc(6, 14), utc(6, 16)))
+
+    def test_window_crossing_midnight(self):
+        self.reserve(date(2025, 11, 7), time(23), time(23, 30))
+        self.reserve(date(2025, 11, 8), time(1), time(2))
+
+        self.assertFalse(machine_available(self.machine, utc(7, 22), utc(8, 0, 30)))
+        self.assertFalse(machine_available(self.machine, utc(7, 23, 45), utc(8, 1, 30)))
+        self.assertTrue(machine_available(self.machine, utc(7, 23, 30), utc(8, 1)))
+        # Whole days in between are covered too
+        self.assertFalse(machine_available(self.machine, utc(4, 20), utc(6, 1)))
+
+    @override_settings(TIME_ZONE="America/New_York")
+    def test_aware_input_is_compared_in_local_time(self):
+        # 18:00 UTC is 13:00 in New York on this date, inside the 13:00-15:00 booking
+        self.assertFalse(machine_available(self.machine, utc(5, 18), utc(5, 19)))
+        # 14:00 UTC is 09:00 local, well before it
+        self.assertTrue(machine_available(self.machine, utc(5, 14), utc(5, 15)))
+
+    def test_rejected_reservations_are_ignored(self):
+        self.reserve(date(2025, 11, 5), time(9), time(10), status="rejected")
+
+        self.assertTrue(machine_available(self.machine, utc(5, 9), utc(5, 10)))
+        self.assertEqual(
+            machine_available(self.machine, utc(5, 9), utc(5, 10), include_conflict=True),
+            {"available": True, "conflict": None},
+        )
+
+    def test_instance_and_id_agree(self):
+        for start, end in [(utc(5, 14), utc(5, 16)), (utc(5, 15), utc(5, 16))]:
+            self.assertEqual(
+                machine_available(self.machine, start, end),
+                machine_available(self.machine.pk, start, end),
+            )
+
+    def test_conflict_details(self):
+        result = machine_available(self.machine.pk, utc(5, 12), utc(5, 14), include_conflict=True)
+
+        self.assertEqual(result, {
+            "available": False,
+            "conflict": {
+                "id": self.booking.pk,
+                "user__email": "bob@example.com",
+                "date": date(2025, 11, 5),
+                "start_time": time(13),
+                "end_time": time(15),
+            },
+        })
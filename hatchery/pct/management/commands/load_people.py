@@ -2,15 +2,18 @@ from __future__ import annotations
 
 import csv
 import json
+from contextlib import nullcontext
+from datetime import date
 from pathlib import Path
 from typing import Optional
 
 from django.core.management.base import BaseCommand, CommandError
 from django.core.exceptions import ValidationError
+from django.db import transaction
+from django.db.models.functions import Lower
 
 from core import constants as const
-from pct import methods
-from pct.models import Person, TrainingCourse
+from pct.models import Person, Certification, TrainingRecord, TrainingCourse
 
 EXAMPLE = (
     "first_name,last_name,email,role,is_team_lead,certifications,training\n"
@@ -18,12 +21,11 @@ EXAMPLE = (
     "Jamie,Chen,jamie@example.com,Team Member,true,Laser Safety,Intro to 3D Printing\n"
 )
 
-ROLE_TO_FUNC = {
-    const.ROLE_USER: methods.add_user,
-    const.ROLE_COLLABORATOR: methods.add_collaborator,
-    const.ROLE_TEAM_MEMBER: methods.add_team_member,
-    const.ROLE_STAFF: methods.add_staff,
-}
+# Accepted spellings of a true is_team_lead cell
+_TRUTHY = frozenset({"1", "true", "yes", "y"})
+
+# Rows processed between bulk inserts of people, certifications and training records
+BATCH_SIZE = 500
 
 
 class Command(BaseCommand):
@@ -53,83 +55,142 @@ class Command(BaseCommand):
 
         dry = options.get("dry_run", False)
         created = updated = cert_count = train_count = 0
+        new_persons: list[Person] = []
+        # Keyed by pk so a person repeated across rows is updated once per flush
+        to_update: dict[int, Person] = {}
+        pending_certs: list[Certification] = []
+        pending_trainings: list[TrainingRecord] = []
+
+        # Load the course catalog once; keep the first match per name like .first() did
+        course_by_name: dict[str, TrainingCourse] = {}
+        for tc in TrainingCourse.objects.only("id", "name"):
+            course_by_name.setdefault(tc.name, tc)
+
+        # One transaction for the whole import so rows are not committed one by one;
+        # a dry run never writes, so it skips the transaction.
+        with nullcontext() if dry else transaction.atomic():
+            with path.open(newline="", encoding="utf-8") as fh:
+                reader = csv.DictReader(fh)
+                required = {"first_name", "last_name", "email", "role"}
+                missing_cols = required - set(reader.fieldnames or [])
+                if missing_cols:
+                    raise CommandError(f"Missing required columns: {sorted(missing_cols)}")
+
+                # Resolve every existing Person in one query instead of once per row
+                rows = list(reader)
+                # Emails are unique case-insensitively, so key everything by lowercase
+                emails = [(row.get("email") or "").strip().lower() for row in rows]
+                existing = {
+                    p.email.lower(): p
+                    for p in Person.raw_objects.alias(email_lower=Lower("email")).filter(email_lower__in=emails)
+                }
+
+                for row_num, row in enumerate(rows, start=1):
+                    if row_num % BATCH_SIZE == 0:
+                        self._flush(new_persons, to_update, pending_certs, pending_trainings)
+
+                    fn = (row.get("first_name") or "").strip()
+                    ln = (row.get("last_name") or "").strip()
+                    email = (row.get("email") or "").strip().lower()
+                    role = (row.get("role") or "").strip()
+                    is_lead = (row.get("is_team_lead") or "").strip().lower() in _TRUTHY
+
+                    if role not in const.ROLES_SET:
+                        self.stdout.write(self.style.WARNING(f"Skipping {email}: invalid role '{role}'."))
+                        continue
 
-        with path.open(newline="", encoding="utf-8") as fh:
-            reader = csv.DictReader(fh)
-            required = {"first_name", "last_name", "email", "role"}
-            missing_cols = required - set(reader.fieldnames or [])
-            if missing_cols:
-                raise CommandError(f"Missing required columns: {sorted(missing_cols)}")
-
-            for row in reader:
-                fn = (row.get("first_name") or "").strip()
-                ln = (row.get("last_name") or "").strip()
-                email = (row.get("email") or "").strip()
-                role = (row.get("role") or "").strip()
-                is_lead = (row.get("is_team_lead") or "").strip().lower() in {"1", "true", "yes", "y"}
-
-                if role not in const.ROLES:
-                    self.stdout.write(self.style.WARNING(f"Skipping {email}: invalid role '{role}'."))
-                    continue
-
-                person = Person.objects.filter(email=email).first()
-
-                try:
-                    if dry:
-                        # Validate as if creating/updating
-                        if person is None:
-                            fnc = ROLE_TO_FUNC[role]
-                            p = fnc(fn, ln, email) if role != const.ROLE_TEAM_MEMBER else methods.add_team_member(fn, ln, email, is_lead)
-                        else:
-                            person.first_name = fn
-                            person.last_name = ln
-                            person.role = role
-                            person.is_team_lead = is_lead if role == const.ROLE_TEAM_MEMBER else False
-                            person.full_clean()
-                    else:
-                        if person is None:
-                            fnc = ROLE_TO_FUNC[role]
-                            if role == const.ROLE_TEAM_MEMBER:
-                                person = methods.add_team_member(fn, ln, email, is_lead)
-                            else:
-                                person = fnc(fn, ln, email)
+                    person = existing.get(email)
+                    values = {
+                        "first_name": fn,
+                        "last_name": ln,
+                        "role": role,
+                        "is_team_lead": is_lead if role == const.ROLE_TEAM_MEMBER else False,
+                    }
+
+                    # Validate on a fresh instance so a rejected row never touches a Person
+                    # already queued for writing. Field checks only; uniqueness was settled
+                    # by the email lookup above.
+                    candidate = Person(email=email, **values)
+                    try:
+                        candidate.clean_fields()
+                    except ValidationError as e:
+                        self.stdout.write(self.style.ERROR(f"Person error for {email}: {e}"))
+                        continue
+
+                    if person is None:
+                        # The INSERT is deferred to the next batch flush
+                        person = candidate
+                        if not dry:
+                            new_persons.append(person)
+                            existing[email] = person
                             created += 1
-                        else:
-                            person.first_name = fn
-                            person.last_name = ln
-                            person.role = role
-                            person.is_team_lead = is_lead if role == const.ROLE_TEAM_MEMBER else False
-                            person.full_clean()
-                            person.save()
-                            updated += 1
-                except ValidationError as e:
-                    self.stdout.write(self.style.ERROR(f"Person error for {email}: {e}"))
-                    continue
-
-                # Certifications (semicolon separated names)
-                certs = [c.strip() for c in (row.get("certifications") or "").split(";") if c.strip()]
-                for cname in certs:
-                    if dry:
-                        cert_count += 1
                     else:
-                        from datetime import date
-                        methods.add_certification(person, cname, issued_at=date.today())
+                        for field, value in values.items():
+                            setattr(person, field, value)
+                        if not dry:
+                            # People still queued for bulk_create pick up the new values on insert
+                            if person.pk is not None:
+                                to_update[person.pk] = person
+                            updated += 1
+
+                    # Certifications (semicolon separated names)
+                    certs = [c.strip() for c in (row.get("certifications") or "").split(";") if c.strip()]
+                    for cname in certs:
+                        if not dry:
+                            cert = Certification(person=person, name=cname, issued_at=date.today())
+                            # The person may not be inserted yet, so skip validating the FK
+                            cert.full_clean(exclude=["person"])
+                            pending_certs.append(cert)
                         cert_count += 1
 
-                # Training (semicolon separated names); try catalog match first
-                trainings = [t.strip() for t in (row.get("training") or "").split(";") if t.strip()]
-                for tname in trainings:
-                    if dry:
+                    # Training (semicolon separated names); try catalog match first
+                    trainings = [t.strip() for t in (row.get("training") or "").split(";") if t.strip()]
+                    for tname in trainings:
+                        if dry:
+                            train_count += 1
+                            continue
+                        tc = course_by_name.get(tname)
+                        record = TrainingRecord(
+                            person=person,
+                            course_name=tc.name if tc is not None else tname,
+                            training_course=tc,
+                        )
+                        # The course came from the catalog, so skip its FK existence query too
+                        record.clean_fields(exclude=["person", "training_course"])
+                        pending_trainings.append(record)
                         train_count += 1
-                        continue
-                    tc = TrainingCourse.objects.filter(name=tname).first()
-                    if tc is not None:
-                        methods.add_training(person, training_course=tc)
-                    else:
-                        methods.add_training(person, course_name=tname)
-                    train_count += 1
+
+                self._flush(new_persons, to_update, pending_certs, pending_trainings)
 
         self.stdout.write(self.style.SUCCESS(
             f"load_people complete. Created: {created}, Updated: {updated}, "
             f"Certifications: {cert_count}, Training records: {train_count}"
         ))
+
+    @staticmethod
+    def _flush(
+        new_persons: list[Person],
+        to_update: dict[int, Person],
+        pending_certs: list[Certification],
+        pending_trainings: list[TrainingRecord],
+    ) -> None:
+        """Write queued people, certifications and training records, then clear the queues.
+
+        People are inserted first so their primary keys are set before the
+        dependent rows referencing them are written. Called inside the import
+        transaction opened by handle().
+        """
+        if not (new_persons or to_update or pending_certs or pending_trainings):
+            return
+        Person.objects.bulk_create(new_persons, batch_size=BATCH_SIZE)
+        Person.objects.bulk_update(
+            to_update.values(),
+            ["first_name", "last_name", "role", "is_team_lead"],
+            batch_size=BATCH_SIZE,
+        )
+        Certification.objects.bulk_create(pending_certs, batch_size=BATCH_SIZE)
+        TrainingRecord.objects.bulk_create(pending_trainings, batch_size=BATCH_SIZE)
+        new_persons.clear()
+        to_update.clear()
+        pending_certs.clear()
+        pending_trainings.clear()
@@ -1,4 +1,5 @@
 from django.core.management.base import BaseCommand
+from pct import methods
 from pct.models import TrainingCourse
 from core import constants as const
 
@@ -44,15 +45,28 @@ class Command(BaseCommand):
     help = 'Load predefined training courses into the catalog.'
 
     def handle(self, *args, **options):
-        created = 0
+        wanted = []
         for category, items in COURSES.items():
             if category not in const.MACHINE_TYPES:
                 self.stdout.write(self.style.WARNING(f"Skipping unknown category '{category}'"))
                 continue
-            for level, name in items:
-                _, was_created = TrainingCourse.objects.get_or_create(
-                    name=name, category=category, level=level
-                )
-                if was_created:
-                    created += 1
+            wanted.extend((category, level, name) for level, name in items)
+
+        # One SELECT for what already exists, one INSERT for the rest
+        existing = set(
+            TrainingCourse.objects.filter(name__in=[name for _, _, name in wanted])
+            .values_list('name', 'category', 'level')
+        )
+        new_courses = [
+            TrainingCourse(name=name, category=category, level=level)
+            for category, level, name in wanted
+            if (name, category, level) not in existing
+        ]
+        # ignore_conflicts hides rows skipped for a concurrent insert, so count what landed
+        before = TrainingCourse.objects.count()
+        TrainingCourse.objects.bulk_create(new_courses, ignore_conflicts=True)
+        created = TrainingCourse.objects.count() - before
+        # bulk_create sends no post_save. This only resets this process's cache (e.g.
+        # under call_command); web processes load new courses on a get_course() miss.
+        methods.clear_course_cache()
         self.stdout.write(self.style.SUCCESS(f"Loaded training courses. Created {created} new entries."))
@@ -1,14 +1,18 @@
 """Convenience methods to create PCT entities (people, certifications, training records).
 
 Each helper accepts either model instances or primary key IDs for related objects.
-They use the shared role constants from hatchery.core.constants and enforce
-Team Lead eligibility (only for Team Members).
+They use the shared role constants from hatchery.core.constants; Team Lead
+eligibility (only for Team Members) and case-insensitive email uniqueness are
+enforced by Person's database constraints. Invalid input, including a duplicate
+email, raises ValidationError.
 """
 from __future__ import annotations
 
-from typing import Optional, Sequence, Union
+from typing import Dict, Optional, Sequence, Union
 
-from django.core.exceptions import ValidationError
+from django.core.exceptions import NON_FIELD_ERRORS, ValidationError
+from django.db import IntegrityError, transaction
+from django.db.models.functions import Lower
 from django.utils import timezone
 
 from core import constants as const
@@ -21,11 +25,48 @@ from pct.models import (
 
 
 def _get_instance(model, obj_or_id):
+    """Return a model instance given either an instance or a primary key value."""
+    if obj_or_id is None:
+        return None
     if isinstance(obj_or_id, model):
         return obj_or_id
     return model.objects.get(pk=obj_or_id)
 
 
+# ---- Training course catalog cache -----------------------------------------
+
+# Process-local copy of the small, slowly changing course catalog, keyed by id.
+# pct.signals resets it whenever a TrainingCourse is saved or deleted.
+_COURSE_CACHE: Optional[Dict[int, TrainingCourse]] = None
+
+
+def all_courses() -> Dict[int, TrainingCourse]:
+    """Return every TrainingCourse keyed by id, loading the catalog on first use."""
+    global _COURSE_CACHE
+    if _COURSE_CACHE is None:
+        _COURSE_CACHE = TrainingCourse.objects.in_bulk()
+    return _COURSE_CACHE
+
+
+def clear_course_cache() -> None:
+    """Drop the cached catalog so the next lookup reloads it."""
+    global _COURSE_CACHE
+    _COURSE_CACHE = None
+
+
+def get_course(course_id: int) -> Optional[TrainingCourse]:
+    """Return a cached TrainingCourse by id, reloading once on a miss.
+
+    A miss usually means the course was added by another process (e.g. a
+    management command), whose signals never reach this one.
+    """
+    course = all_courses().get(course_id)
+    if course is None:
+        clear_course_cache()
+        course = all_courses().get(course_id)
+    return course
+
+
 # ---- Person helpers ---------------------------------------------------------
 
 def _add_person(
@@ -34,9 +75,20 @@ def _add_person(
     email: str,
     role: str,
     is_team_lead: bool = False,
+    _skip_validation: bool = False,
 ) -> Person:
-    if role not in const.ROLES:
+    """Create a Person.
+
+    The public add_* helpers pick a known-valid role and pass _skip_validation=True:
+    the role check and full_clean()'s unique-email query are skipped, fields are
+    still validated, and a duplicate email caught by the database UNIQUE index is
+    reported like full_clean() reports the expression-based constraint, under
+    NON_FIELD_ERRORS.
+    """
+    if not _skip_validation and role not in const.ROLES_SET:
         raise ValidationError({"role": f"Invalid role: {role}"})
+    # Stored lowercase, like every other writer since migration 0010
+    email = email.strip().lower()
     person = Person(
         first_name=first_name,
         last_name=last_name,
@@ -44,20 +96,35 @@ def _add_person(
         role=role,
         is_team_lead=is_team_lead,
     )
-    # Will enforce team lead eligibility via model validation
-    person.full_clean()
-    person.save()
+    if _skip_validation:
+        person.clean_fields()
+        try:
+            with transaction.atomic():
+                person.save(force_insert=True)
+        except IntegrityError:
+            taken = Person.raw_objects.alias(email_lower=Lower("email")).filter(email_lower=email)
+            if not taken.exists():
+                raise
+            raise ValidationError({NON_FIELD_ERRORS: "A person with this email already exists."})
+    else:
+        # Will enforce team lead eligibility via the model's check constraint
+        person.full_clean()
+        person.save()
     return person
 
 
 def add_user(first_name: str, last_name: str, email: str) -> Person:
     """Create a Person with role User."""
-    return _add_person(first_name, last_name, email, const.ROLE_USER, is_team_lead=False)
+    return _add_person(
+        first_name, last_name, email, const.ROLE_USER, is_team_lead=False, _skip_validation=True
+    )
 
 
 def add_collaborator(first_name: str, last_name: str, email: str) -> Person:
     """Create a Person with role Collaborator."""
-    return _add_person(first_name, last_name, email, const.ROLE_COLLABORATOR, is_team_lead=False)
+    return _add_person(
+        first_name, last_name, email, const.ROLE_COLLABORATOR, is_team_lead=False, _skip_validation=True
+    )
 
 
 def add_team_member(
@@ -67,12 +134,16 @@ def add_team_member(
     is_team_lead: bool = False,
 ) -> Person:
     """Create a Person with role Team Member, optionally flagged as Team Lead."""
-    return _add_person(first_name, last_name, email, const.ROLE_TEAM_MEMBER, is_team_lead=is_team_lead)
+    return _add_person(
+        first_name, last_name, email, const.ROLE_TEAM_MEMBER, is_team_lead=is_team_lead, _skip_validation=True
+    )
 
 
 def add_staff(first_name: str, last_name: str, email: str) -> Person:
     """Create a Person with role Staff."""
-    return _add_person(first_name, last_name, email, const.ROLE_STAFF, is_team_lead=False)
+    return _add_person(
+        first_name, last_name, email, const.ROLE_STAFF, is_team_lead=False, _skip_validation=True
+    )
 
 
 def add_team_lead(first_name: str, last_name: str, email: str) -> Person:
@@ -106,13 +177,13 @@ def add_training(
 
     Provide either course_name or training_course. If only training_course is
     provided, course_name will be auto-populated from it. completed_at defaults
-    to now if not provided (matching model auto_now_add behavior).
+    to now if not provided (the database default on the model).
     """
     if not course_name and not training_course:
         raise ValidationError("Provide either course_name or training_course.")
 
     person_obj = _get_instance(Person, person)
-    tc_obj = _get_instance(TrainingCourse, training_course) if training_course is not None else None
+    tc_obj = _get_instance(TrainingCourse, training_course)
 
     name_to_use = course_name or (tc_obj.name if tc_obj else None)
     if not name_to_use:
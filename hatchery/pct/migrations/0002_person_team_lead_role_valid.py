@@ -0,0 +1,19 @@
+# Generated by Django 5.2.7 on 2026-10-15 08:33
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('pct', '0001_initial'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddConstraint(
+            model_name='person',
+            constraint=models.CheckConstraint(condition=models.Q(('is_team_lead', False), ('role', 'Team Member'), _connector='OR'), name='team_lead_role_valid'),
+        ),
+    ]
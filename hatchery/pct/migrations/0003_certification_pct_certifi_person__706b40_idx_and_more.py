@@ -0,0 +1,31 @@
+# Generated by Django 5.2.7 on 2026-10-15 08:34
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('pct', '0002_person_team_lead_role_valid'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='certification',
+            index=models.Index(fields=['person', 'expires_at'], name='pct_certifi_person__706b40_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='certification',
+            index=models.Index(fields=['expires_at'], name='pct_certifi_expires_b57e36_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='person',
+            index=models.Index(fields=['role', 'is_team_lead'], name='pct_person_role_8963a7_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='trainingrecord',
+            index=models.Index(fields=['person', '-completed_at'], name='pct_trainin_person__d21405_idx'),
+        ),
+    ]
@@ -0,0 +1,19 @@
+# Generated by Django 5.2.7 on 2026-10-15 08:34
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('pct', '0003_certification_pct_certifi_person__706b40_idx_and_more'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddConstraint(
+            model_name='person',
+            constraint=models.CheckConstraint(condition=models.Q(('role__in', ['User', 'Collaborator', 'Team Member', 'Staff'])), name='person_role_valid'),
+        ),
+    ]
@@ -0,0 +1,17 @@
+# Generated by Django 5.2.7 on 2026-10-15 08:35
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('pct', '0004_person_person_role_valid'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='trainingrecord',
+            index=models.Index(fields=['person', 'training_course'], name='pct_trainin_person__a379d6_idx'),
+        ),
+    ]
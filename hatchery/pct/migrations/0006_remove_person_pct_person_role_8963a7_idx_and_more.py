@@ -0,0 +1,27 @@
+# Generated by Django 5.2.7 on 2026-10-15 08:36
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('pct', '0005_normalize_training_course_fk'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='person',
+            name='pct_person_role_8963a7_idx',
+        ),
+        migrations.AddIndex(
+            model_name='person',
+            index=models.Index(condition=models.Q(('role', 'User'), _negated=True), fields=['role'], name='person_nonuser_role_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='person',
+            index=models.Index(condition=models.Q(('is_team_lead', True)), fields=['is_team_lead'], name='person_team_lead_idx'),
+        ),
+    ]
@@ -0,0 +1,17 @@
+# Generated by Django 5.2.7 on 2026-10-15 08:37
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('pct', '0006_remove_person_pct_person_role_8963a7_idx_and_more'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='trainingcourse',
+            index=models.Index(fields=['category', 'level', 'name'], name='course_cat_lvl_name_idx'),
+        ),
+    ]
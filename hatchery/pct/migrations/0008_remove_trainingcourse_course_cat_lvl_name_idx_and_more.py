@@ -0,0 +1,25 @@
+# Generated by Django 5.2.7 on 2026-10-15 08:37
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('pct', '0007_trainingcourse_course_cat_lvl_name_idx'),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='trainingcourse',
+            name='course_cat_lvl_name_idx',
+        ),
+        migrations.AlterUniqueTogether(
+            name='trainingcourse',
+            unique_together=set(),
+        ),
+        migrations.AddConstraint(
+            model_name='trainingcourse',
+            constraint=models.UniqueConstraint(fields=('category', 'level', 'name'), name='uq_course_cat_lvl_name'),
+        ),
+    ]
@@ -0,0 +1,19 @@
+# Generated by Django 5.2.7 on 2026-10-15 08:38
+
+import django.db.models.functions.datetime
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('pct', '0008_remove_trainingcourse_course_cat_lvl_name_idx_and_more'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='trainingrecord',
+            name='completed_at',
+            field=models.DateTimeField(db_default=django.db.models.functions.datetime.Now(), editable=False),
+        ),
+    ]
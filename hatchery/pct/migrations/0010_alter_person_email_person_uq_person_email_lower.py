@@ -0,0 +1,46 @@
+# Generated by Django 5.2.7 on 2026-10-15 08:39
+
+import django.db.models.functions.text
+from django.conf import settings
+from django.db import migrations, models
+from django.db.models import Count
+from django.db.models.functions import Lower
+
+
+def lowercase_emails(apps, schema_editor):
+    """Store emails lowercased, refusing to continue if that would merge two people."""
+    Person = apps.get_model('pct', 'Person')
+    collisions = list(
+        Person.objects.annotate(email_lower=Lower('email'))
+        .values('email_lower')
+        .annotate(n=Count('id'))
+        .filter(n__gt=1)
+        .values_list('email_lower', flat=True)
+    )
+    if collisions:
+        raise RuntimeError(
+            'Cannot add uq_person_email_lower: these emails belong to more than one '
+            f'person when compared case-insensitively; merge them first: {sorted(collisions)}'
+        )
+    Person.objects.exclude(email=Lower('email')).update(email=Lower('email'))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('pct', '0009_alter_trainingrecord_completed_at'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='person',
+            name='email',
+            field=models.EmailField(max_length=254),
+        ),
+        migrations.RunPython(lowercase_emails, migrations.RunPython.noop),
+        migrations.AddConstraint(
+            model_name='person',
+            constraint=models.UniqueConstraint(django.db.models.functions.text.Lower('email'), name='uq_person_email_lower', violation_error_message='A person with this email already exists.'),
+        ),
+    ]
@@ -0,0 +1,20 @@
+# Generated by Django 5.2.7 on 2026-10-15 08:40
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('pct', '0010_alter_person_email_person_uq_person_email_lower'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AlterConstraint(
+            model_name='person',
+            name='team_lead_role_valid',
+            constraint=models.CheckConstraint(condition=models.Q(('is_team_lead', False), ('role', 'Team Member'), _connector='OR'), name='team_lead_role_valid', violation_error_message='Team Lead can only be set when role is Team Member.'),
+        ),
+    ]
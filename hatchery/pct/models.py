@@ -1,14 +1,27 @@
 from django.db import models
-from django.core.exceptions import ValidationError
+from django.db.models import Q
+from django.db.models.functions import Lower, Now
 from core import constants as const
 from django.contrib.auth.models import User
 
 
+class PersonManager(models.Manager):
+    """Default manager; joins the linked auth user for code that reads ``person.user``.
+
+    Because of the join, ``only()`` or ``defer()`` calls that leave out ``user``
+    raise FieldError here; use ``Person.raw_objects`` for those queries.
+    """
+
+    def get_queryset(self):
+        return super().get_queryset().select_related('user')
+
+
 class Person(models.Model):
     user = models.OneToOneField(User, on_delete=models.CASCADE, null=True, blank=True)
     first_name = models.CharField(max_length=100)
     last_name = models.CharField(max_length=100)
-    email = models.EmailField(unique=True)
+    # Unique case-insensitively via the uq_person_email_lower constraint below
+    email = models.EmailField()
     role = models.CharField(
         max_length=50,
         choices=[(r, r) for r in const.ROLES],
@@ -17,20 +30,37 @@ class Person(models.Model):
     # Team Lead is only meaningful when role is Team Member
     is_team_lead = models.BooleanField(default=False)
 
-    def __str__(self):
-        return f"{self.first_name} {self.last_name}"
+    objects = PersonManager()
+    # Unjoined access, e.g. for queries that use only()/defer() or never touch user
+    raw_objects = models.Manager()
 
-    def clean(self):
-        # Enforce that Team Lead flag only applies to Team Members
-        if self.is_team_lead and self.role != const.TEAM_LEAD_ELIGIBLE_ROLE:
-            raise ValidationError({
-                'is_team_lead': 'Team Lead can only be set when role is Team Member.'
-            })
+    class Meta:
+        # Partial indexes: most people are plain Users, and roster queries look
+        # for the other roles or for team leads.
+        indexes = [
+            models.Index(fields=['role'], name='person_nonuser_role_idx', condition=~Q(role=const.ROLE_USER)),
+            models.Index(fields=['is_team_lead'], name='person_team_lead_idx', condition=Q(is_team_lead=True)),
+        ]
+        constraints = [
+            models.UniqueConstraint(
+                Lower('email'),
+                name='uq_person_email_lower',
+                violation_error_message='A person with this email already exists.',
+            ),
+            models.CheckConstraint(
+                condition=Q(role__in=const.ROLES),
+                name='person_role_valid',
+            ),
+            # Team Lead only applies to Team Members; full_clean() reports this message
+            models.CheckConstraint(
+                condition=Q(is_team_lead=False) | Q(role=const.TEAM_LEAD_ELIGIBLE_ROLE),
+                name='team_lead_role_valid',
+                violation_error_message='Team Lead can only be set when role is Team Member.',
+            ),
+        ]
 
-    def save(self, *args, **kwargs):
-        # Ensure model validation runs on save
-        self.full_clean()
-        return super().save(*args, **kwargs)
+    def __str__(self):
+        return f"{self.first_name} {self.last_name}"
 
 
 class Certification(models.Model):
@@ -39,6 +69,12 @@ class Certification(models.Model):
     issued_at = models.DateField()
     expires_at = models.DateField(null=True, blank=True)
 
+    class Meta:
+        indexes = [
+            models.Index(fields=['person', 'expires_at']),
+            models.Index(fields=['expires_at']),
+        ]
+
     def __str__(self):
         return f"{self.name} ({self.person})"
 
@@ -46,7 +82,25 @@ class Certification(models.Model):
 class TrainingRecord(models.Model):
     person = models.ForeignKey(Person, on_delete=models.CASCADE, related_name='training_records')
     course_name = models.CharField(max_length=200)
-    completed_at = models.DateTimeField(auto_now_add=True)
+    # Stamped by the database rather than Python, so bulk imports need no
+    # per-row timezone.now(); an explicit value can still be assigned.
+    completed_at = models.DateTimeField(db_default=Now(), editable=False)
+    # Backward-compatible link from a record to a cataloged course (optional)
+    training_course = models.ForeignKey(
+        'TrainingCourse',
+        on_delete=models.SET_NULL,
+        null=True,
+        blank=True,
+        related_name='records',
+        db_index=True,
+    )
+
+    class Meta:
+        indexes = [
+            models.Index(fields=['person', '-completed_at']),
+            # Covers per-person "which courses are done" lookups (cmr reservation checks)
+            models.Index(fields=['person', 'training_course']),
+        ]
 
     def __str__(self):
         return f"{self.course_name} - {self.person}"
@@ -59,14 +113,12 @@ class TrainingCourse(models.Model):
     level = models.PositiveSmallIntegerField()
 
     class Meta:
-        unique_together = ('name', 'category', 'level')
         ordering = ['category', 'level', 'name']
+        constraints = [
+            # Column order matches the default ordering, so this one index both
+            # enforces uniqueness and serves catalog listings in order
+            models.UniqueConstraint(fields=['category', 'level', 'name'], name='uq_course_cat_lvl_name'),
+        ]
 
     def __str__(self):
         return f"Lvl {self.level} - {self.name} ({self.category})"
-
-# Backward-compatible link from a record to a cataloged course (optional)
-TrainingRecord.add_to_class(
-    'training_course',
-    models.ForeignKey('TrainingCourse', on_delete=models.SET_NULL, null=True, blank=True, related_name='records')
-)
@@ -1,61 +1,78 @@
 from allauth.account.signals import user_signed_up, user_logged_in
+from django.db import IntegrityError, transaction
+from django.db.models import Case, CharField, F, Value, When
+from django.db.models.signals import post_delete, post_save
 from django.dispatch import receiver
-from pct.models import Person
+from pct import methods
+from pct.models import Person, TrainingCourse
 from core import constants as const
 
-@receiver(user_signed_up)
-def create_person_on_signup(sender, request, user, **kwargs):
-    """Create a Person record after signup if it doesn't exist."""
+# Session key holding the pk of the user whose Person this session already synced
+_PERSON_SYNCED_KEY = "_person_synced"
+
+# Static part of a new Person; per-user fields are merged in by _sync_person
+_BASE_DEFAULTS = {"role": const.ROLE_USER}
+
+def _fill_blank(field, value):
+    """SQL expression that sets ``field`` to ``value`` only where it is currently empty."""
+    return Case(When(**{field: ""}, then=Value(value)), default=F(field), output_field=CharField())
+
+def _mark_synced(request, user):
+    session = getattr(request, "session", None)
+    if session is not None:
+        session[_PERSON_SYNCED_KEY] = user.pk
+
+def _sync_person(user) -> None:
+    """Create the user's Person, or fill its blank name/email fields from the User.
+
+    One SELECT reads the current values; a complete Person, the usual case on
+    login, is never written. Blank fields are filled by a conditional UPDATE and
+    a Person is only instantiated when none exists. Role validity is enforced by
+    a DB constraint. The result is remembered on the (per-request) user instance,
+    so later signals in the same request are free.
+    """
+    if getattr(user, "_person_synced", False):
+        return
     first = user.first_name or ""
     last = user.last_name or ""
+    email = (user.email or "").lower()
+    current = Person.raw_objects.filter(user=user).values_list("first_name", "last_name", "email").first()
+    if current is None:
+        defaults = {**_BASE_DEFAULTS, "first_name": first, "last_name": last, "email": email}
+        try:
+            with transaction.atomic():
+                Person.objects.create(user=user, **defaults)
+        except IntegrityError:
+            # A concurrent first login created it between the SELECT and the INSERT
+            if not Person.raw_objects.filter(user=user).exists():
+                raise
+    elif "" in current:
+        Person.raw_objects.filter(user=user).update(
+            first_name=_fill_blank("first_name", first),
+            last_name=_fill_blank("last_name", last),
+            email=_fill_blank("email", email),
+        )
+    user._person_synced = True
 
-    # Use user as the unique key
-    person, created = Person.objects.get_or_create(
-        user=user,
-        defaults={
-            "first_name": first,
-            "last_name": last,
-            "email": user.email,
-            "role": const.ROLE_USER,
-        }
-    )
-
-    if not created:
-        # Ensure role stays valid
-        if person.role not in const.ROLES:
-            person.role = const.ROLE_USER
-        # Update name/email from user if missing
-        if not person.first_name:
-            person.first_name = first
-        if not person.last_name:
-            person.last_name = last
-        if not person.email:
-            person.email = user.email
-        person.save()
+@receiver(user_signed_up)
+def create_person_on_signup(sender, request, user, **kwargs):
+    """Create a Person record after signup if it doesn't exist."""
+    _sync_person(user)
+    # allauth logs the new user in right after signup; skip the repeat sync. The
+    # flag names the user, so a signup that stays logged out (pending email
+    # verification) cannot excuse whoever logs in next on this session.
+    _mark_synced(request, user)
 
 @receiver(user_logged_in)
 def create_person_on_login(sender, request, user, **kwargs):
     """Ensure a Person exists on login."""
-    person, created = Person.objects.get_or_create(
-        user=user,
-        defaults={
-            "first_name": user.first_name or "",
-            "last_name": user.last_name or "",
-            "email": user.email,
-            "role": const.ROLE_USER,
-        }
-    )
-    if not created:
-        # Update missing fields
-        updated = False
-        if not person.first_name:
-            person.first_name = user.first_name or ""
-            updated = True
-        if not person.last_name:
-            person.last_name = user.last_name or ""
-            updated = True
-        if not person.email:
-            person.email = user.email
-            updated = True
-        if updated:
-            person.save()
+    session = getattr(request, "session", None)
+    if session is not None and session.get(_PERSON_SYNCED_KEY) == user.pk:
+        return
+    _sync_person(user)
+    _mark_synced(request, user)
+
+@receiver([post_save, post_delete], sender=TrainingCourse)
+def reset_course_cache(sender, **kwargs):
+    """Invalidate the in-process course catalog when a course changes."""
+    methods.clear_course_cache()
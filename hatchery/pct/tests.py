@@ -0,0 +1,236 @@
+import tempfile
+from io import StringIO
+from pathlib import Path
+from types import SimpleNamespace
+from unittest import mock
+
+from allauth.account.signals import user_logged_in, user_signed_up
+from django.contrib.auth.models import User
+from django.core.exceptions import NON_FIELD_ERRORS, ValidationError
+from django.core.management import call_command
+from django.db import IntegrityError
+from django.db.models.query import QuerySet
+from django.test import TestCase
+
+from core import constants as const
+from pct import methods, signals
+from pct.models import Person, Certification, TrainingRecord, TrainingCourse
+
+HEADER = "first_name,last_name,email,role,is_team_lead,certifications,training\n"
+
+
+class LoadPeopleCommandTests(TestCase):
+    def load(self, body, **options):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / "people.csv"
+            path.write_text(HEADER + body, encoding="utf-8")
+            out = StringIO()
+            call_command("load_people", file=str(path), stdout=out, **options)
+        return out.getvalue()
+
+    def test_creates_people_with_certifications_and_training(self):
+        course = TrainingCourse.objects.create(name="Intro to 3D Printing", category="3D Printing", level=1)
+        self.load(
+            "Alex,Rivera,alex@example.com,User,false,,Intro to 3D Printing;Custom Class\n"
+            "Jamie,Chen,Jamie@Example.com,Team Member,true,Laser Safety,\n"
+        )
+
+        jamie = Person.objects.get(email="jamie@example.com")
+        self.assertEqual(jamie.role, "Team Member")
+        self.assertTrue(jamie.is_team_lead)
+        self.assertEqual(list(jamie.certifications.values_list("name", flat=True)), ["Laser Safety"])
+
+        alex = Person.objects.get(email="alex@example.com")
+        records = {r.course_name: r for r in alex.training_records.all()}
+        self.assertEqual(records["Intro to 3D Printing"].training_course, course)
+        self.assertIsNone(records["Custom Class"].training_course)
+        self.assertIsNotNone(records["Custom Class"].completed_at)
+
+    def test_updates_existing_person(self):
+        Person.objects.create(first_name="Old", last_name="Name", email="alex@example.com")
+        out = self.load("Alex,Rivera,ALEX@example.com,Staff,yes,,\n")
+
+        person = Person.objects.get()
+        self.assertEqual((person.first_name, person.last_name, person.role), ("Alex", "Rivera", "Staff"))
+        # Team Lead only applies to Team Members
+        self.assertFalse(person.is_team_lead)
+        self.assertIn("Created: 0, Updated: 1", out)
+
+    def test_rejected_row_does_not_change_existing_person(self):
+        Person.objects.create(first_name="Old", last_name="Name", email="u7@example.com")
+        out = self.load(
+            "Una,Seven,u7@example.com,User,false,,\n"
+            ",One,u7@example.com,Staff,false,,\n"
+        )
+
+        self.assertIn("Person error for u7@example.com", out)
+        person = Person.objects.get()
+        self.assertEqual((person.first_name, person.last_name, person.role), ("Una", "Seven", "User"))
+        self.assertIn("Updated: 1", out)
+
+    def test_repeated_email_updates_the_queued_person(self):
+        self.load(
+            "Jamie,Chen,jamie@example.com,Team Member,true,CPR,\n"
+            "Jamie,Cheng,jamie@example.com,Staff,false,Laser Safety,\n"
+        )
+
+        person = Person.objects.get()
+        self.assertEqual((person.last_name, person.role, person.is_team_lead), ("Cheng", "Staff", False))
+        self.assertEqual(person.certifications.count(), 2)
+
+    def test_rejected_repeat_row_does_not_change_queued_person(self):
+        out = self.load(
+            "Jamie,Chen,jamie@example.com,User,false,,\n"
+            f"{'x' * 101},Chen,jamie@example.com,Staff,false,CPR,\n"
+        )
+
+        self.assertIn("Person error for jamie@example.com", out)
+        person = Person.objects.get()
+        self.assertEqual((person.first_name, person.role), ("Jamie", "User"))
+        self.assertFalse(Certification.objects.exists())
+
+    def test_rows_spanning_a_batch_boundary(self):
+        rows = "".join(f"P{i},Last,p{i}@example.com,User,false,Cert {i},Class {i}\n" for i in range(5))
+        with mock.patch("pct.management.commands.load_people.BATCH_SIZE", 2):
+            self.load(rows + "P0,Again,p0@example.com,Collaborator,false,,\n")
+
+        self.assertEqual(Person.objects.count(), 5)
+        self.assertEqual(Person.objects.get(email="p0@example.com").role, "Collaborator")
+        self.assertEqual(Certification.objects.count(), 5)
+        self.assertEqual(TrainingRecord.objects.count(), 5)
+        for cert in Certification.objects.select_related("person"):
+            self.assertEqual(cert.name, f"Cert {cert.person.first_name[1:]}")
+
+    def test_dry_run_writes_nothing(self):
+        Person.objects.create(first_name="Old", last_name="Name", email="alex@example.com")
+        out = self.load(
+            "Alex,Rivera,alex@example.com,Staff,false,CPR,Class\n"
+            "Jamie,Chen,jamie@example.com,User,false,,\n",
+            dry_run=True,
+        )
+
+        self.assertIn("Created: 0, Updated: 0", out)
+        self.assertEqual(list(Person.objects.values_list("first_name", "role")), [("Old", "User")])
+        self.assertFalse(Certification.objects.exists())
+        self.assertFalse(TrainingRecord.objects.exists())
+
+
+class AddPersonTests(TestCase):
+    def test_duplicate_email_raises_the_same_error_on_both_paths(self):
+        methods.add_user("Alex", "Rivera", "alex@example.com")
+
+        with self.assertRaises(ValidationError) as fast:
+            methods.add_staff("Alex", "Rivera", "ALEX@example.com")
+        with self.assertRaises(ValidationError) as validated:
+            methods._add_person("Alex", "Rivera", "ALEX@example.com", const.ROLE_STAFF)
+        self.assertEqual(fast.exception.message_dict, validated.exception.message_dict)
+        self.assertIn(NON_FIELD_ERRORS, fast.exception.message_dict)
+        self.assertEqual(Person.objects.count(), 1)
+
+    def test_email_is_stored_lowercase(self):
+        person = methods.add_staff("C", "D", " Mixed@BC.edu ")
+
+        person.refresh_from_db()
+        self.assertEqual(person.email, "mixed@bc.edu")
+
+
+class PersonSyncSignalTests(TestCase):
+    def setUp(self):
+        self.user = User.objects.create(
+            username="alex", email="Alex@Example.com", first_name="Alex", last_name="Rivera"
+        )
+        self.request = SimpleNamespace(session={})
+
+    def signup(self, user=None):
+        user_signed_up.send(sender=User, request=self.request, user=user or self.user)
+
+    def login(self, user=None):
+        user_logged_in.send(sender=User, request=self.request, user=user or self.user)
+
+    def test_signup_creates_person_with_lowercased_email(self):
+        self.signup()
+
+        person = Person.objects.get(user=self.user)
+        self.assertEqual(
+            (person.first_name, person.last_name, person.email, person.role),
+            ("Alex", "Rivera", "alex@example.com", const.ROLE_USER),
+        )
+        self.assertEqual(self.request.session[signals._PERSON_SYNCED_KEY], self.user.pk)
+
+    def test_login_fills_only_blank_fields(self):
+        Person.objects.create(user=self.user, first_name="Al", last_name="", email="")
+        self.login()
+
+        person = Person.objects.get(user=self.user)
+        self.assertEqual((person.first_name, person.last_name, person.email), ("Al", "Rivera", "alex@example.com"))
+
+    def test_login_with_complete_person_only_reads(self):
+        Person.objects.create(user=self.user, first_name="Al", last_name="R", email="al@example.com")
+
+        with self.assertNumQueries(1):
+            self.login()
+        self.assertEqual(Person.objects.get(user=self.user).first_name, "Al")
+
+    def test_login_after_signup_skips_the_sync(self):
+        self.signup()
+        user = User.objects.get(pk=self.user.pk)
+
+        with self.assertNumQueries(0):
+            self.login(user)
+
+    def test_session_flag_for_another_user_does_not_skip(self):
+        other = User.objects.create(username="jamie", email="jamie@example.com")
+        self.signup(other)
+        self.login()
+
+        self.assertTrue(Person.objects.filter(user=self.user).exists())
+        self.assertEqual(self.request.session[signals._PERSON_SYNCED_KEY], self.user.pk)
+
+    def test_sync_is_remembered_on_the_user_instance(self):
+        signals._sync_person(self.user)
+
+        with self.assertNumQueries(0):
+            signals._sync_person(self.user)
+
+    def test_concurrent_create_is_treated_as_synced(self):
+        # Another login inserted the Person after this one's SELECT came back empty
+        Person.objects.create(user=self.user, first_name="Alex", last_name="Rivera", email="alex@example.com")
+        with mock.patch.object(QuerySet, "first", return_value=None):
+            signals._sync_person(self.user)
+
+        self.assertTrue(self.user._person_synced)
+        self.assertEqual(Person.objects.filter(user=self.user).count(), 1)
+
+    def test_email_owned_by_another_person_still_raises(self):
+        Person.objects.create(user=None, first_name="Alex", last_name="Rivera", email="alex@example.com")
+
+        with self.assertRaises(IntegrityError):
+            self.signup()
+        self.assertFalse(Person.objects.filter(user=self.user).exists())
+
+
+class CourseCacheTests(TestCase):
+    def setUp(self):
+        methods.clear_course_cache()
+        self.addCleanup(methods.clear_course_cache)
+        self.course = TrainingCourse.objects.create(name="Intro to 3D Printing", category="3D Printing", level=1)
+
+    def test_saving_or_deleting_a_course_resets_the_cache(self):
+        self.assertIn(self.course.pk, methods.all_courses())
+
+        self.course.name = "3D Printing Basics"
+        self.course.save()
+        self.assertEqual(methods.get_course(self.course.pk).name, "3D Printing Basics")
+
+        self.course.delete()
+        self.assertEqual(methods.all_courses(), {})
+
+    def test_get_course_reloads_on_a_miss(self):
+        methods.all_courses()
+        # bulk_create sends no post_save, like an insert from another process
+        (added,) = TrainingCourse.objects.bulk_create(
+            [TrainingCourse(name="Soldering Basics Training", category="Electronics", level=1)]
+        )
+
+        self.assertEqual(methods.get_course(added.pk).name, "Soldering Basics Training")
+        self.assertIsNone(methods.get_course(added.pk + 100))